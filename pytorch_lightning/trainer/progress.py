@@ -11,19 +11,323 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from dataclasses import asdict, dataclass, field
-from typing import Type
+import itertools
+import sys
+from dataclasses import dataclass, field, fields, MISSING
+from functools import lru_cache
+from typing import Any, Callable, cast, Dict, get_type_hints, Iterator, List, Optional, Tuple, Type, TypeVar
 
+_T = TypeVar("_T")
 
+# how many levels of nested progress objects get inlined into the generated functions
+_MAX_INLINE_DEPTH = 3
+
+# the version of the tuples pickled by the progress objects, to increase when the fields of a progress class change
+_STATE_VERSION = 1
+
+
+def _create_fn(name: str, args: str, body: List[str], globals: Optional[Dict[str, Any]] = None) -> Callable:
+    """Compile a function from its source lines, similarly to how :mod:`dataclasses` generates its methods."""
+    txt = f"def {name}({args}):\n" + "\n".join(f"  {line}" for line in body)
+    ns: Dict[str, Any] = {}
+    exec(txt, globals, ns)
+    return ns[name]
+
+
+def _cache_per_class(fn: Callable[[Type["BaseProgress"]], _T]) -> Callable[[Type["BaseProgress"]], _T]:
+    """Cache the results of ``fn`` for each class it's called with.
+
+    This is :func:`functools.lru_cache`, typed explicitly as mypy doesn't consider the dataclasses to be ``Hashable``.
+    """
+    return cast(Callable[[Type["BaseProgress"]], _T], lru_cache(maxsize=None)(fn))
+
+
+def _add_slots(cls: type) -> type:
+    """Re-create the dataclass ``cls`` with ``__slots__`` for its fields, as ``@dataclass(slots=True)`` does in
+    Python 3.10+.
+
+    The instances don't carry a ``__dict__``, which makes them smaller and their attribute access faster.
+    """
+    if sys.version_info < (3, 7):
+        # the `__class__` cell used by `super()` is read-only
+        return cls
+    cls_dict = dict(cls.__dict__)
+    inherited_slots = {name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())}
+    slots = tuple(f.name for f in fields(cls) if f.name not in inherited_slots)
+    for name in slots:
+        # remove the class variables holding the defaults, these would conflict with the slots
+        cls_dict.pop(name, None)
+    if "__weakref__" not in inherited_slots:
+        # keep the instances weak-referenceable, as they were before having slots
+        slots += ("__weakref__",)
+    cls_dict["__slots__"] = slots
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    metaclass: Type[type] = type(cls)
+    new_cls = metaclass(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    # zero-argument `super()` finds the class through a closure cell, which still points to the old class
+    for value in cls_dict.values():
+        if isinstance(value, property):
+            functions = (value.fget, value.fset, value.fdel)
+        else:
+            functions = (getattr(value, "__func__", value),)
+        for fn in functions:
+            for cell in getattr(fn, "__closure__", None) or ():
+                if cell.cell_contents is cls:
+                    cell.cell_contents = new_cls
+    return new_cls
+
+
+@_cache_per_class
+def _field_types(cls: Type["BaseProgress"]) -> Dict[str, Any]:
+    """Return the annotations of the fields of ``cls``, resolving the string annotations when possible."""
+    try:
+        hints = get_type_hints(cls)
+    except (NameError, TypeError):
+        # e.g. a forward reference to a class defined in a local scope
+        hints = {}
+    return {f.name: hints.get(f.name, f.type) for f in fields(cls)}
+
+
+@_cache_per_class
+def _state_fields(cls: Type["BaseProgress"]) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """Return the names of the fields of ``cls``, the subset of them holding a progress object created by their
+    default factory and the subset whose value needs to be inspected at runtime.
+
+    These are resolved once per class as :func:`dataclasses.fields` walks the class attributes on every call.
+    """
+    names, nested, dynamic = [], [], []
+    types = _field_types(cls)
+    for f in fields(cls):
+        names.append(f.name)
+        annotation = types[f.name]
+        if not isinstance(annotation, type):
+            # e.g. `Optional[Progress]` or an unresolved forward reference
+            dynamic.append(f.name)
+        elif issubclass(annotation, BaseProgress):
+            if f.default_factory is MISSING:
+                # the field can hold another value, e.g. `progress: Progress = None`
+                dynamic.append(f.name)
+            else:
+                nested.append(f.name)
+    return tuple(names), tuple(nested), tuple(dynamic)
+
+
+def _state_dict_value(value: Any) -> Any:
+    return value.state_dict() if isinstance(value, BaseProgress) else value
+
+
+def _load_state_dict_value(obj: "BaseProgress", name: str, value: Any) -> None:
+    current = getattr(obj, name)
+    if isinstance(current, BaseProgress) and isinstance(value, dict):
+        current.load_state_dict(value)
+    else:
+        setattr(obj, name, value)
+
+
+@_cache_per_class
+def _repr_fn(cls: Type["BaseProgress"]) -> Callable[["BaseProgress"], str]:
+    """Generate a ``__repr__`` implementation for ``cls`` formatting all its fields in a single f-string.
+
+    Unlike the one generated by :mod:`dataclasses`, it does not guard against recursive references, so it is only
+    meant for classes whose fields can't hold other progress objects.
+    """
+    names, _, _ = _state_fields(cls)
+    fields_repr = ", ".join(f"{name}={{self.{name}!r}}" for name in names)
+    fn = _create_fn("__repr__", "self", [f'return f"{{self.__class__.__qualname__}}({fields_repr})"'])
+    fn.__qualname__ = f"{cls.__qualname__}.__repr__"
+    return fn
+
+
+def _state_dict_lines(
+    cls: Type["BaseProgress"],
+    default: Optional["BaseProgress"],
+    obj: str,
+    depth: int,
+    globals: Dict[str, Any],
+    counter: Iterator[int],
+) -> Tuple[List[str], str]:
+    """Return the lines computing the nested states of ``obj`` and the dictionary literal holding its state.
+
+    ``default`` is the default value of ``obj`` when it is nested, see :func:`_default_value`.
+    """
+    names, nested, dynamic = _state_fields(cls)
+    lines, items = [], []
+    for name in names:
+        if name in dynamic:
+            items.append(f"{name!r}: _state_dict_value({obj}.{name})")
+            continue
+        if name not in nested:
+            items.append(f"{name!r}: {obj}.{name}")
+            continue
+        value_default = _default_value(cls, name, default)
+        expected_cls = type(value_default)
+        if (
+            depth >= _MAX_INLINE_DEPTH
+            or not isinstance(value_default, BaseProgress)
+            or expected_cls.state_dict is not BaseProgress.state_dict
+        ):
+            items.append(f"{name!r}: {obj}.{name}.state_dict()")
+            continue
+        # the field can hold a subclass of its type, so its state is only inlined for the class of its default
+        value, result, cls_name = f"_v{depth}", f"_d{next(counter)}", f"_cls{len(globals)}"
+        globals[cls_name] = expected_cls
+        inlined, literal = _state_dict_lines(expected_cls, value_default, value, depth + 1, globals, counter)
+        lines += [f"{value} = {obj}.{name}", f"if type({value}) is {cls_name}:"]
+        lines += [f"  {line}" for line in inlined]
+        lines += [f"  {result} = {literal}", "else:", f"  {result} = {value}.state_dict()"]
+        items.append(f"{name!r}: {result}")
+    return lines, f"{{{', '.join(items)}}}"
+
+
+@_cache_per_class
+def _state_dict_fn(cls: Type["BaseProgress"]) -> Callable[["BaseProgress"], dict]:
+    """Generate the ``state_dict`` implementation of ``cls``.
+
+    The generated function returns a dictionary literal with one entry per field, which avoids the reflection and the
+    ``deepcopy`` calls done by :func:`dataclasses.asdict`. The states of the nested progress objects are inlined, up to
+    ``_MAX_INLINE_DEPTH`` levels.
+    """
+    globals: Dict[str, Any] = {"_state_dict_value": _state_dict_value}
+    lines, literal = _state_dict_lines(cls, None, "self", 0, globals, itertools.count())
+    fn = _create_fn("state_dict", "self", lines + [f"return {literal}"], globals)
+    fn.__qualname__ = f"{cls.__qualname__}.state_dict"
+    return fn
+
+
+@_cache_per_class
+def _getstate_fn(cls: Type["BaseProgress"]) -> Callable[["BaseProgress"], tuple]:
+    """Generate the ``__getstate__`` implementation of ``cls``, returning the state version and the field values in
+    declaration order.
+
+    The subclasses that aren't slotted keep the ``(__dict__, slots_dict)`` state of the default reduction.
+    """
+    names, _, _ = _state_fields(cls)
+    if cls.__dictoffset__:
+        body = f"return (self.__dict__, {{{''.join(f'{name!r}: self.{name}, ' for name in names)}}})"
+    else:
+        body = f"return ({_STATE_VERSION}, {''.join(f'self.{name}, ' for name in names)})"
+    fn = _create_fn("__getstate__", "self", [body])
+    fn.__qualname__ = f"{cls.__qualname__}.__getstate__"
+    return fn
+
+
+@_cache_per_class
+def _setstate_fn(cls: Type["BaseProgress"]) -> Callable[["BaseProgress", Any], None]:
+    """Generate the ``__setstate__`` implementation of ``cls``, unpacking the tuple returned by ``__getstate__``."""
+    names, _, _ = _state_fields(cls)
+    body = [
+        f"if type(state) is not tuple or state[0] != {_STATE_VERSION}:",
+        "  return _setstate_by_name(self, state)",
+        f"_, {''.join(f'self.{name}, ' for name in names)}= state",
+    ]
+    fn = _create_fn("__setstate__", "self, state", body, {"_setstate_by_name": _setstate_by_name})
+    fn.__qualname__ = f"{cls.__qualname__}.__setstate__"
+    return fn
+
+
+def _setstate_by_name(obj: "BaseProgress", state: Any) -> None:
+    """Restore a state keyed by attribute name: the ``(__dict__, slots_dict)`` state of the subclasses that aren't
+    slotted, or the ``__dict__`` pickled before the progress classes had slots."""
+    if isinstance(state, dict):
+        state = (state, None)
+    if not (isinstance(state, tuple) and len(state) == 2 and all(s is None or isinstance(s, dict) for s in state)):
+        raise TypeError(f"Unrecognized state for `{type(obj).__name__}`: {state!r}")
+    for attributes in state:
+        for name, value in (attributes or {}).items():
+            setattr(obj, name, value)
+
+
+def _default_value(cls: Type["BaseProgress"], name: str, default: Optional["BaseProgress"]) -> Any:
+    """Return the default value of the nested progress field ``name`` of ``cls``.
+
+    This is the value held by ``default``, the default value of the object itself when it is nested too, otherwise a
+    value created by the default factory of the field. Its class can differ from the annotation and from the default
+    of the nested class, e.g. the ``Progress`` objects of ``OptimizerProgress`` hold ``ReadyCompletedTracker`` and
+    ``StartedTracker`` trackers rather than the ``ProcessedTracker`` default of ``Progress``.
+    """
+    if default is not None:
+        return getattr(default, name)
+    # `_state_fields` only considers the fields with a default factory as nested
+    factory = cast(Callable[[], Any], cls.__dataclass_fields__[name].default_factory)
+    return factory()
+
+
+def _load_state_dict_lines(
+    cls: Type["BaseProgress"],
+    default: Optional["BaseProgress"],
+    obj: str,
+    state_dict: str,
+    depth: int,
+    globals: Dict[str, Any],
+) -> List[str]:
+    names, nested, dynamic = _state_fields(cls)
+    lines = []
+    for name in names:
+        # the keys missing from `state_dict` are skipped so that partial states can be loaded
+        lines.append(f"if {name!r} in {state_dict}:")
+        value_state_dict = f"{state_dict}[{name!r}]"
+        if name in dynamic:
+            lines.append(f"  _load_state_dict_value({obj}, {name!r}, {value_state_dict})")
+            continue
+        if name not in nested:
+            lines.append(f"  {obj}.{name} = {value_state_dict}")
+            continue
+        # the variables are named after the depth so the inlined blocks don't overwrite the ones of their parents
+        value, value_state_dict = f"_v{depth}", f"_s{depth}"
+        lines += [f"  {value} = {obj}.{name}", f"  {value_state_dict} = {state_dict}[{name!r}]"]
+        load_call = f"{value}.load_state_dict({value_state_dict})"
+        value_default = _default_value(cls, name, default)
+        expected_cls = type(value_default)
+        if (
+            depth >= _MAX_INLINE_DEPTH
+            or not isinstance(value_default, BaseProgress)
+            or expected_cls.load_state_dict is not BaseProgress.load_state_dict
+        ):
+            lines.append(f"  {load_call}")
+            continue
+        # the field can hold a subclass of its type, so its assignments are only inlined for the class of its default
+        cls_name = f"_cls{len(globals)}"
+        globals[cls_name] = expected_cls
+        lines.append(f"  if type({value}) is {cls_name}:")
+        inlined = _load_state_dict_lines(expected_cls, value_default, value, value_state_dict, depth + 1, globals)
+        lines += [f"    {line}" for line in inlined or ["pass"]]
+        lines += ["  else:", f"    {load_call}"]
+    return lines
+
+
+@_cache_per_class
+def _load_state_dict_fn(cls: Type["BaseProgress"]) -> Callable[["BaseProgress", dict], None]:
+    """Generate the ``load_state_dict`` implementation of ``cls``.
+
+    The fields are assigned one by one. The assignments of the nested progress objects are inlined, up to
+    ``_MAX_INLINE_DEPTH`` levels, to avoid a function call and a new generated function lookup per nested object.
+    """
+    globals: Dict[str, Any] = {"_load_state_dict_value": _load_state_dict_value}
+    body = _load_state_dict_lines(cls, None, "self", "state_dict", 0, globals)
+    fn = _create_fn("load_state_dict", "self, state_dict", body or ["pass"], globals)
+    fn.__qualname__ = f"{cls.__qualname__}.load_state_dict"
+    return fn
+
+
+@_add_slots
 @dataclass
 class BaseProgress:
     """Mixin that implements state-loading utilities for dataclasses."""
 
     def state_dict(self) -> dict:
-        return asdict(self)
+        return _state_dict_fn(type(self))(self)
 
     def load_state_dict(self, state_dict: dict) -> None:
-        self.__dict__.update(state_dict)
+        _load_state_dict_fn(type(self))(self, state_dict)
+
+    def __getstate__(self) -> tuple:
+        # pickled as a flat tuple rather than as the `(None, slots_dict)` pair used for classes with `__slots__`
+        return _getstate_fn(type(self))(self)
+
+    def __setstate__(self, state: Any) -> None:
+        _setstate_fn(type(self))(self, state)
 
     @classmethod
     def from_state_dict(cls, state_dict: dict) -> "BaseProgress":
@@ -32,6 +336,7 @@ class BaseProgress:
         return obj
 
 
+@_add_slots
 @dataclass
 class ReadyCompletedTracker(BaseProgress):
     """Track an event's progress.
@@ -59,8 +364,12 @@ class ReadyCompletedTracker(BaseProgress):
         """
         self.ready = self.completed
 
+    def __repr__(self) -> str:
+        return _repr_fn(type(self))(self)
 
-@dataclass
+
+@_add_slots
+@dataclass(repr=False)
 class StartedTracker(ReadyCompletedTracker):
     """Track an event's progress.
 
@@ -75,15 +384,17 @@ class StartedTracker(ReadyCompletedTracker):
     started: int = 0
 
     def reset(self) -> None:
-        super().reset()
+        self.ready = 0
         self.started = 0
+        self.completed = 0
 
     def reset_on_restart(self) -> None:
-        super().reset_on_restart()
+        self.ready = self.completed
         self.started = self.completed
 
 
-@dataclass
+@_add_slots
+@dataclass(repr=False)
 class ProcessedTracker(StartedTracker):
     """Track an event's progress.
 
@@ -99,14 +410,18 @@ class ProcessedTracker(StartedTracker):
     processed: int = 0
 
     def reset(self) -> None:
-        super().reset()
+        self.ready = 0
+        self.started = 0
         self.processed = 0
+        self.completed = 0
 
     def reset_on_restart(self) -> None:
-        super().reset_on_restart()
+        self.ready = self.completed
+        self.started = self.completed
         self.processed = self.completed
 
 
+@_add_slots
 @dataclass
 class Progress(BaseProgress):
     """Track aggregated and current progress.
@@ -120,6 +435,7 @@ class Progress(BaseProgress):
     current: ReadyCompletedTracker = field(default_factory=ProcessedTracker)
 
     def __post_init__(self) -> None:
+        # this lets the `increment_*` methods rely on `total` to validate the attributes of `current` too
         if type(self.total) is not type(self.current):  # noqa: E721
             raise ValueError("The `total` and `current` instances should be of the same class")
 
@@ -128,15 +444,17 @@ class Progress(BaseProgress):
         self.current.ready += 1
 
     def increment_started(self) -> None:
-        if not isinstance(self.total, StartedTracker):
-            raise TypeError(f"`{self.total.__class__.__name__}` doesn't have a `started` attribute")
-        self.total.started += 1
+        try:
+            self.total.started += 1
+        except AttributeError:
+            raise TypeError(f"`{self.total.__class__.__name__}` doesn't have a `started` attribute") from None
         self.current.started += 1
 
     def increment_processed(self) -> None:
-        if not isinstance(self.total, ProcessedTracker):
-            raise TypeError(f"`{self.total.__class__.__name__}` doesn't have a `processed` attribute")
-        self.total.processed += 1
+        try:
+            self.total.processed += 1
+        except AttributeError:
+            raise TypeError(f"`{self.total.__class__.__name__}` doesn't have a `processed` attribute") from None
         self.current.processed += 1
 
     def increment_completed(self) -> None:
@@ -157,11 +475,8 @@ class Progress(BaseProgress):
     def reset_on_restart(self) -> None:
         self.current.reset_on_restart()
 
-    def load_state_dict(self, state_dict: dict) -> None:
-        self.total.load_state_dict(state_dict["total"])
-        self.current.load_state_dict(state_dict["current"])
-
 
+@_add_slots
 @dataclass
 class DataLoaderProgress(Progress):
     """Tracks dataloader progress.
@@ -177,6 +492,7 @@ class DataLoaderProgress(Progress):
     current: ReadyCompletedTracker = field(default_factory=ReadyCompletedTracker)
 
 
+@_add_slots
 @dataclass
 class BatchProgress(Progress):
     """Tracks batch progress.
@@ -195,11 +511,8 @@ class BatchProgress(Progress):
         super().reset_on_run()
         self.is_last_batch = False
 
-    def load_state_dict(self, state_dict: dict) -> None:
-        super().load_state_dict(state_dict)
-        self.is_last_batch = state_dict["is_last_batch"]
-
 
+@_add_slots
 @dataclass
 class SchedulerProgress(Progress):
     """Tracks scheduler progress.
@@ -215,6 +528,7 @@ class SchedulerProgress(Progress):
     current: ReadyCompletedTracker = field(default_factory=ReadyCompletedTracker)
 
 
+@_add_slots
 @dataclass
 class OptimizerProgress(BaseProgress):
     """Track optimizer progress.
@@ -235,11 +549,8 @@ class OptimizerProgress(BaseProgress):
         self.step.reset_on_restart()
         self.zero_grad.reset_on_restart()
 
-    def load_state_dict(self, state_dict: dict) -> None:
-        self.step.load_state_dict(state_dict["step"])
-        self.zero_grad.load_state_dict(state_dict["zero_grad"])
-
 
+@_add_slots
 @dataclass
 class OptimizationProgress(BaseProgress):
     """Track optimization progress.
@@ -265,7 +576,3 @@ class OptimizationProgress(BaseProgress):
 
     def reset_on_restart(self) -> None:
         self.optimizer.reset_on_restart()
-
-    def load_state_dict(self, state_dict: dict) -> None:
-        self.optimizer.load_state_dict(state_dict["optimizer"])
-        self.optimizer_position = state_dict["optimizer_position"]
@@ -11,18 +11,25 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import pickle
+import weakref
 from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Optional
 
 import pytest
 
 from pytorch_lightning.trainer.progress import (
     BaseProgress,
+    BatchProgress,
+    OptimizationProgress,
     OptimizerProgress,
     ProcessedTracker,
     Progress,
     ReadyCompletedTracker,
     StartedTracker,
 )
+from tests.helpers.runif import RunIf
 
 
 def test_tracker_reset():
@@ -41,6 +48,11 @@ def test_tracker_reset_on_restart():
     assert t == ProcessedTracker(ready=2, started=2, processed=2, completed=2)
 
 
+def test_tracker_repr():
+    assert repr(ReadyCompletedTracker(ready=1)) == "ReadyCompletedTracker(ready=1, completed=0)"
+    assert repr(ProcessedTracker(completed=2)) == "ProcessedTracker(ready=0, completed=2, started=0, processed=0)"
+
+
 @pytest.mark.parametrize("attr", ("ready", "started", "processed", "completed"))
 def test_progress_increment(attr):
     p = Progress()
@@ -87,6 +99,7 @@ def test_progress_raises():
         p.increment_started()
     with pytest.raises(TypeError, match="ReadyCompletedTracker` doesn't have a `processed` attribute"):
         p.increment_processed()
+    assert p == Progress(ReadyCompletedTracker(), ReadyCompletedTracker())
 
 
 def test_optimizer_progress_default_factory():
@@ -102,7 +115,153 @@ def test_optimizer_progress_default_factory():
     assert p2.step.total.completed == 0
 
 
+def test_load_partial_state_dict():
+    t = ProcessedTracker(completed=2)
+    t.load_state_dict({"ready": 3})
+    assert t == ProcessedTracker(ready=3, completed=2)
+
+    p = BatchProgress()
+    p.load_state_dict({"total": {"ready": 1}, "is_last_batch": True})
+    assert p == BatchProgress(total=ProcessedTracker(ready=1), is_last_batch=True)
+
+
+@pytest.mark.parametrize("tracker_cls", (ProcessedTracker, StartedTracker))
+def test_progress_load_state_dict(tracker_cls):
+    expected = Progress.from_defaults(tracker_cls, ready=2, completed=1)
+    p = Progress.from_defaults(tracker_cls)
+    p.load_state_dict(expected.state_dict())
+    assert p == expected
+    # the nested objects are loaded in-place
+    assert type(p.total) is tracker_cls
+
+
+@RunIf(min_python="3.7")
+def test_slots():
+    p = BatchProgress()
+    assert not hasattr(p, "__dict__")
+    assert not hasattr(p.total, "__dict__")
+    with pytest.raises(AttributeError):
+        p.foo = 1
+    assert weakref.ref(p)() is p
+
+    # zero-argument `super()` keeps working in the re-created classes
+    p.is_last_batch = True
+    p.reset_on_run()
+    assert not p.is_last_batch
+
+
 def test_deepcopy():
     _ = deepcopy(BaseProgress())
     _ = deepcopy(Progress())
     _ = deepcopy(ProcessedTracker())
+
+
+def test_optimization_progress_state_dict():
+    p = OptimizationProgress()
+    p.optimizer.step.increment_ready()
+    p.optimizer_position = 1
+    assert p.state_dict() == {
+        "optimizer": {
+            "step": {"total": {"ready": 1, "completed": 0}, "current": {"ready": 1, "completed": 0}},
+            "zero_grad": {
+                "total": {"ready": 0, "started": 0, "completed": 0},
+                "current": {"ready": 0, "started": 0, "completed": 0},
+            },
+        },
+        "optimizer_position": 1,
+    }
+
+
+def test_optimization_progress_inlined_state(monkeypatch):
+    p = OptimizationProgress()
+    p.optimizer.zero_grad.increment_started()
+    state_dict = p.state_dict()
+    # generate the functions before patching the trackers
+    OptimizationProgress().load_state_dict(state_dict)
+
+    def raises(*_):
+        raise RuntimeError("The tracker states should be inlined")
+
+    monkeypatch.setattr(ReadyCompletedTracker, "state_dict", raises)
+    monkeypatch.setattr(ReadyCompletedTracker, "load_state_dict", raises)
+    assert p.state_dict() == state_dict
+    loaded = OptimizationProgress()
+    loaded.load_state_dict(state_dict)
+    assert loaded == p
+
+
+def test_state_dict_does_not_deepcopy(monkeypatch):
+    def deepcopy_raises(*_, **__):
+        raise RuntimeError("`deepcopy` should not be called")
+
+    monkeypatch.setattr("copy.deepcopy", deepcopy_raises)
+    p = BatchProgress()
+    p.increment_ready()
+    loaded = BatchProgress.from_state_dict(p.state_dict())
+    assert loaded == p
+
+
+def test_nested_progress_annotations():
+    @dataclass
+    class Nested(BaseProgress):
+        string: "Progress" = field(default_factory=Progress)
+        optional: Optional[Progress] = field(default_factory=Progress)
+        unresolved: "UndefinedProgress" = field(default_factory=Progress)  # noqa: F821
+        empty: Optional[Progress] = None
+        untyped_empty: Progress = None
+
+    p = Nested()
+    p.string.increment_ready()
+    p.optional.increment_ready()
+    p.unresolved.increment_ready()
+    expected = {"total": ProcessedTracker(ready=1).state_dict(), "current": ProcessedTracker(ready=1).state_dict()}
+    assert p.state_dict() == {
+        "string": expected,
+        "optional": expected,
+        "unresolved": expected,
+        "empty": None,
+        "untyped_empty": None,
+    }
+
+    loaded = Nested()
+    loaded.load_state_dict(p.state_dict())
+    assert loaded == p
+    assert isinstance(loaded.optional, Progress)
+    assert isinstance(loaded.unresolved, Progress)
+
+
+def test_pickle():
+    p = OptimizationProgress()
+    p.optimizer.zero_grad.increment_started()
+    p.optimizer_position = 1
+    assert p.__getstate__() == (1, p.optimizer, 1)
+    loaded = pickle.loads(pickle.dumps(p))
+    assert loaded == p
+    assert loaded.optimizer.zero_grad.total is not p.optimizer.zero_grad.total
+
+
+def test_unpickle_previous_format():
+    # pickled before the progress classes defined `__getstate__`: the state is the `__dict__` of the instance
+    data = (
+        b"\x80\x02cpytorch_lightning.trainer.progress\nProgress\nq\x00)\x81q\x01}q\x02(X\x05\x00\x00\x00totalq\x03"
+        b"cpytorch_lightning.trainer.progress\nStartedTracker\nq\x04)\x81q\x05}q\x06(X\x05\x00\x00\x00readyq\x07K"
+        b"\x02X\t\x00\x00\x00completedq\x08K\x00X\x07\x00\x00\x00startedq\tK\x00ubX\x07\x00\x00\x00currentq\nh"
+        b"\x04)\x81q\x0b}q\x0c(h\x07K\x02h\x08K\x00h\tK\x00ubub."
+    )
+    assert pickle.loads(data) == Progress.from_defaults(StartedTracker, ready=2)
+
+    # a tuple pickled with a different version of the fields
+    with pytest.raises(TypeError, match="Unrecognized state"):
+        ProcessedTracker().__setstate__((0, 5, 3, 0, 0))
+
+
+class _ProgressWithAttributes(Progress):
+    pass
+
+
+def test_pickle_instance_dict():
+    p = _ProgressWithAttributes.from_defaults(StartedTracker, ready=1)
+    p.x = 1
+    for loaded in (pickle.loads(pickle.dumps(p)), deepcopy(p)):
+        assert loaded == p
+        assert loaded.x == 1